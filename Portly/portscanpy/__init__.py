@@ -8,13 +8,22 @@ and support for concurrent scanning of multiple ports.
 __version__ = "1.0.0"
 __author__ = "Nick Barwick"
 
-from .scanner import scan_ports, parse_ports, ScanResult
-from .services import get_service_name, COMMON_PORTS
+from .scanner import (
+    scan_ports,
+    scan_open_ports,
+    stream_open_ports,
+    parse_ports,
+    ScanResult,
+)
+from .services import get_service_name, COMMON_PORTS, TOP_PORTS
 
 __all__ = [
     "scan_ports",
+    "scan_open_ports",
+    "stream_open_ports",
     "parse_ports",
     "ScanResult",
     "get_service_name",
     "COMMON_PORTS",
+    "TOP_PORTS",
 ]
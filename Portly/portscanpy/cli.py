@@ -12,7 +12,32 @@ import sys
 import time
 from typing import Any
 
-from .scanner import parse_ports, scan_ports, ScanResult
+from .scanner import parse_ports, scan_open_ports, ScanResult
+from .services import TOP_PORTS
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+def _dumps(obj: Any) -> str:
+    """
+    Serialize an object to indented JSON, using orjson when installed.
+
+    The two encoders agree on layout, but orjson writes non-ASCII text
+    (e.g. an internationalized target name) as UTF-8, whereas ``json.dumps``
+    emits ``\\uXXXX`` escapes.
+
+    Args:
+        obj: The object to serialize
+
+    Returns:
+        The JSON document as a string
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
 
 
 def format_human_output(
@@ -20,7 +45,7 @@ def format_human_output(
     port_spec: str,
     timeout: float,
     workers: int,
-    results: list[ScanResult],
+    open_results: list[ScanResult],
     scan_time: float,
     verbose: bool = False,
 ) -> None:
@@ -32,7 +57,8 @@ def format_human_output(
         port_spec: The port specification string
         timeout: Socket timeout used
         workers: Number of workers used
-        results: List of scan results
+        open_results: Scan results for the open ports only, as returned
+            by scan_open_ports
         scan_time: Total scan time in seconds
         verbose: Whether to show verbose output
     """
@@ -48,27 +74,24 @@ def format_human_output(
 
     print(f"Ports: {port_spec} | Timeout: {timeout}s | Workers: {workers}\n")
 
-    # Filter to show only open ports
-    open_ports = [r for r in results if r["status"] == "open"]
-
-    if not open_ports:
+    if not open_results:
         print("No open ports found.")
     else:
-        for result in open_ports:
+        for result in open_results:
             port = result["port"]
             status = result["status"]
             service = result["service"] or "unknown"
             print(f"[+] {port}/tcp   {status:8s} {service}")
 
     print(f"\nScan complete in {scan_time:.2f} seconds.")
-    print(f"Open ports: {len(open_ports)}")
+    print(f"Open ports: {len(open_results)}")
 
 
 def format_json_output(
     target: str,
     port_spec: str,
     timeout: float,
-    results: list[ScanResult],
+    open_results: list[ScanResult],
     scan_time: float,
 ) -> None:
     """
@@ -78,13 +101,10 @@ def format_json_output(
         target: The target hostname or IP
         port_spec: The port specification string
         timeout: Socket timeout used
-        results: List of scan results
+        open_results: Scan results for the open ports only, as returned
+            by scan_open_ports
         scan_time: Total scan time in seconds
     """
-    # For JSON output, include only open ports by default
-    # (can be modified to include all if needed)
-    open_results = [r for r in results if r["status"] == "open"]
-
     output: dict[str, Any] = {
         "target": target,
         "ports_scanned": port_spec,
@@ -96,7 +116,8 @@ def format_json_output(
         },
     }
 
-    print(json.dumps(output, indent=2))
+    sys.stdout.write(_dumps(output))
+    sys.stdout.write("\n")
 
 
 def main() -> None:
@@ -109,7 +130,9 @@ Examples:
   %(prog)s 192.168.1.10
   %(prog)s scanme.nmap.org -p 20-1024
   %(prog)s scanme.nmap.org -p 22,80,443 --json
+  %(prog)s scanme.nmap.org --top
   %(prog)s example.com -p 1-65535 -w 500 -t 1.0
+  sudo %(prog)s example.com -p 1-65535 --syn
 
 Note: Only scan hosts you own or have explicit permission to test.
         """,
@@ -120,13 +143,21 @@ Note: Only scan hosts you own or have explicit permission to test.
         help="Target hostname or IP address to scan",
     )
 
-    parser.add_argument(
+    port_group = parser.add_mutually_exclusive_group()
+
+    port_group.add_argument(
         "-p",
         "--ports",
         default="1-1024",
         help='Port specification: single (80), list (22,80,443), or range (1-1024). Default: "1-1024"',
     )
 
+    port_group.add_argument(
+        "--top",
+        action="store_true",
+        help=f"Scan the {len(TOP_PORTS)} most common service ports",
+    )
+
     parser.add_argument(
         "-t",
         "--timeout",
@@ -143,6 +174,16 @@ Note: Only scan hosts you own or have explicit permission to test.
         help="Maximum number of concurrent workers (default: 100)",
     )
 
+    parser.add_argument(
+        "-s",
+        "--syn",
+        action="store_true",
+        help=(
+            "Use raw SYN scanning (requires CAP_NET_RAW on Linux, e.g. root; "
+            "otherwise falls back to connect scanning)"
+        ),
+    )
+
     parser.add_argument(
         "-j",
         "--json",
@@ -160,12 +201,18 @@ Note: Only scan hosts you own or have explicit permission to test.
     args = parser.parse_args()
 
     # Parse port specification
-    try:
-        ports = parse_ports(args.ports)
-    except ValueError as e:
-        print(f"Error: {e}", file=sys.stderr)
-        print("\nUse -h or --help for usage information.", file=sys.stderr)
-        sys.exit(1)
+    port_spec = args.ports
+
+    if args.top:
+        ports = TOP_PORTS
+        port_spec = f"top-{len(TOP_PORTS)}"
+    else:
+        try:
+            ports = parse_ports(args.ports)
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            print("\nUse -h or --help for usage information.", file=sys.stderr)
+            sys.exit(1)
 
     if not ports:
         print("Error: No valid ports to scan.", file=sys.stderr)
@@ -178,11 +225,12 @@ Note: Only scan hosts you own or have explicit permission to test.
         if args.verbose and not args.json:
             print(f"Starting scan of {len(ports)} ports...")
 
-        results = scan_ports(
+        open_results = scan_open_ports(
             host=args.target,
             ports=ports,
             timeout=args.timeout,
             max_workers=args.workers,
+            method="syn" if args.syn else "connect",
         )
 
         scan_time = time.time() - start_time
@@ -191,18 +239,18 @@ Note: Only scan hosts you own or have explicit permission to test.
         if args.json:
             format_json_output(
                 target=args.target,
-                port_spec=args.ports,
+                port_spec=port_spec,
                 timeout=args.timeout,
-                results=results,
+                open_results=open_results,
                 scan_time=scan_time,
             )
         else:
             format_human_output(
                 target=args.target,
-                port_spec=args.ports,
+                port_spec=port_spec,
                 timeout=args.timeout,
                 workers=args.workers,
-                results=results,
+                open_results=open_results,
                 scan_time=scan_time,
                 verbose=args.verbose,
             )
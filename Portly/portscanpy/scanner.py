@@ -5,120 +5,765 @@ This module provides the main port scanning logic using concurrent socket
 connections to check if ports are open or closed on a target host.
 """
 
+import asyncio
+import errno
+import functools
+import queue
+import re
+import selectors
 import socket
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Dict, List, Optional, Set, TypedDict
+import sys
+import time
+from array import array
+from concurrent.futures import Executor, Future
+from itertools import islice
+from operator import itemgetter
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, TypedDict
 
-from .services import get_service_name
+from . import scanner_iouring, scanner_syn
+from .services import TOP_PORTS, TOP_SERVICES, get_service_name
+from .sockopts import open_probe_socket, tune_probe_socket
+
+# Supported values for the scan ``method`` argument
+SCAN_METHODS = ("connect", "syn")
+
+# Worker counts at or above this use the selector-based scan
+SELECT_MIN_WORKERS = 256
+
+# A single port ("80") or range ("20-1024") within a port specification
+_PORT_PART_RE = re.compile(r"\s*(\d+)\s*(?:-\s*(\d+)\s*)?")
+
+# Characters of a plain port specification ("1-1024", "22,80,443")
+_PLAIN_SPEC_CHARS = frozenset("0123456789,-")
+
+# Longer port specifications are parsed without being cached, so the cache
+# keys stay small however large the submitted specs are
+_MAX_CACHED_SPEC_LEN = 256
+
+# Zero-copy source for filling port ranges into a bitmap
+_ONES = memoryview(b"\x01" * 65536)
 
 
 class ScanResult(TypedDict):
     """Type definition for a single port scan result."""
     port: int
-    status: str  # "open" or "closed"
+    status: str  # "open", "closed" or "filtered"
     service: Optional[str]
 
 
-def scan_single_port(host: str, port: int, timeout: float) -> ScanResult:
+def scan_single_port(
+    host: str,
+    port: int,
+    timeout: float,
+    _addr: Optional[Tuple[str, int]] = None,
+) -> ScanResult:
     """
     Scan a single port on the target host.
 
+    Passing an already-resolved IP as ``host`` (or a prebuilt sockaddr as
+    ``_addr``) avoids a DNS lookup per port when scanning many ports.
+
     Args:
         host: The hostname or IP address to scan
         port: The port number to check
         timeout: Socket timeout in seconds
+        _addr: Optional prebuilt ``(ip, port)`` sockaddr to connect to
 
     Returns:
-        A ScanResult dictionary containing port, status, and service name
+        A ScanResult dictionary containing port, status, and service name;
+        the status is "filtered" if the connect timed out
     """
-    result: ScanResult = {
-        "port": port,
-        "status": "closed",
-        "service": None,
-    }
-
+    # connect_ex releases the GIL for the connect and its timeout wait, so
+    # keep the Python-level work around it to a minimum
     try:
-        # Create a TCP socket
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        try:
+            tune_probe_socket(sock)
             sock.settimeout(timeout)
-            # Attempt to connect
-            connection_result = sock.connect_ex((host, port))
-
-            if connection_result == 0:
-                result["status"] = "open"
-                result["service"] = get_service_name(port)
-    except socket.gaierror:
-        # DNS resolution failed
-        pass
+            connection_result = sock.connect_ex(_addr or (host, port))
+        finally:
+            sock.close()
     except socket.timeout:
-        # Connection timed out
-        pass
+        connection_result = errno.EAGAIN
     except Exception:
-        # Any other exception, treat as closed
-        pass
+        # DNS failure or any other error, treat as closed
+        connection_result = -1
+
+    if connection_result == 0:
+        return {"port": port, "status": "open", "service": get_service_name(port)}
+    if connection_result in (errno.EAGAIN, errno.EWOULDBLOCK):
+        # connect_ex reports a timed-out connect as EAGAIN
+        return {"port": port, "status": "filtered", "service": None}
+    return {"port": port, "status": "closed", "service": None}
+
+
+def _resolve(host: str) -> str:
+    """
+    Resolve a hostname to an IPv4 address.
+
+    Args:
+        host: The hostname or IP address to resolve
+
+    Returns:
+        The resolved IPv4 address
+
+    Raises:
+        socket.gaierror: If the hostname cannot be resolved
+    """
+    try:
+        return socket.gethostbyname(host)
+    except socket.gaierror as e:
+        raise socket.gaierror(f"Cannot resolve hostname: {host}") from e
+
+
+async def _scan_one(
+    ip: str,
+    port: int,
+    timeout: float,
+    sem: asyncio.Semaphore,
+) -> str:
+    """
+    Probe a single port on the event loop.
+
+    Args:
+        ip: The resolved IP address to scan
+        port: The port number to check
+        timeout: Connection timeout in seconds
+        sem: Semaphore bounding the number of in-flight connections
+
+    Returns:
+        The port status: "open", "closed", or "filtered" if the connect
+        timed out
+    """
+    loop = asyncio.get_running_loop()
+
+    async with sem:
+        sock = open_probe_socket()
+        try:
+            await asyncio.wait_for(loop.sock_connect(sock, (ip, port)), timeout)
+        except asyncio.TimeoutError:
+            return "filtered"
+        except OSError:
+            return "closed"
+        finally:
+            sock.close()
+
+    return "open"
+
+
+async def _scan_all(
+    host: str,
+    ports: Sequence[int],
+    timeout: float,
+    max_workers: int,
+) -> List[str]:
+    """
+    Probe all ports concurrently on the running event loop.
+
+    The host is resolved once up front so individual connections do not
+    repeat the DNS lookup.
+
+    Args:
+        host: The hostname or IP address to scan
+        ports: Sequence of port numbers to scan
+        timeout: Connection timeout in seconds
+        max_workers: Maximum number of concurrent connections
+
+    Returns:
+        The status of each port, in the same order as ``ports``
+
+    Raises:
+        socket.gaierror: If the hostname cannot be resolved
+    """
+    loop = asyncio.get_running_loop()
+
+    # First, verify the host is resolvable
+    try:
+        infos = await loop.getaddrinfo(
+            host, None, family=socket.AF_INET, type=socket.SOCK_STREAM
+        )
+    except socket.gaierror as e:
+        raise socket.gaierror(f"Cannot resolve hostname: {host}") from e
+
+    ip = infos[0][4][0]
+    sem = asyncio.Semaphore(max_workers)
+
+    return list(
+        await asyncio.gather(*[_scan_one(ip, port, timeout, sem) for port in ports])
+    )
+
+
+def scan_single_port_nb(
+    ip: str,
+    port: int,
+    sel: selectors.BaseSelector,
+    data: Any = None,
+) -> Optional[str]:
+    """
+    Start a non-blocking connect to a single port.
+
+    If the connect completes or fails immediately the socket is closed and
+    the port status returned. Otherwise the socket is registered with ``sel``
+    for write readiness (carrying ``data``) and None is returned; the caller
+    finishes the probe with ``_finish_probe`` once the socket is ready.
+
+    Args:
+        ip: The resolved IP address to scan
+        port: The port number to check
+        sel: Selector to register the pending connect with
+        data: Opaque value stored on the selector key
+
+    Returns:
+        The port status if already known, otherwise None
+    """
+    sock = open_probe_socket()
+    try:
+        err = sock.connect_ex((ip, port))
+    except OSError:
+        sock.close()
+        return "closed"
+
+    if err in (errno.EINPROGRESS, errno.EWOULDBLOCK):
+        sel.register(sock, selectors.EVENT_WRITE, data)
+        return None
+
+    sock.close()
+    return "open" if err == 0 else "closed"
+
+
+def _finish_probe(sock: socket.socket) -> str:
+    """
+    Classify a probe socket that became writable and close it.
+
+    Reading SO_ERROR tells a completed handshake from a refused one as soon
+    as the kernel knows, so refused ports never wait for the timeout.
+
+    Args:
+        sock: The probe socket reported ready by the selector
+
+    Returns:
+        "open" if the connect succeeded, otherwise "closed"
+    """
+    try:
+        err = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+    finally:
+        sock.close()
+
+    return "open" if err == 0 else "closed"
+
+
+def _iter_select_chunks(
+    ip: str,
+    ports: Sequence[int],
+    timeout: float,
+    chunk: int,
+) -> Iterator[List[str]]:
+    """
+    Probe ports chunk by chunk from a single thread with non-blocking connects.
+
+    Ports whose connect has not completed by the deadline are reported as
+    "filtered", since no SYN-ACK or RST came back.
+
+    Args:
+        ip: The resolved IP address to scan
+        ports: Sequence of port numbers to scan
+        timeout: Socket timeout in seconds
+        chunk: Number of connections in flight at once
+
+    Yields:
+        The statuses of each successive ``chunk`` of ports, in order
+    """
+    for start in range(0, len(ports), chunk):
+        batch = ports[start:start + chunk]
+        statuses: List[str] = ["filtered"] * len(batch)
+
+        with selectors.DefaultSelector() as sel:
+            try:
+                for index, port in enumerate(batch):
+                    status = scan_single_port_nb(ip, port, sel, index)
+                    if status is not None:
+                        statuses[index] = status
+
+                # Harvest sockets as they become writable until the deadline
+                deadline = time.monotonic() + timeout
+                while sel.get_map():
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    for key, _ in sel.select(remaining):
+                        sel.unregister(key.fileobj)
+                        statuses[key.data] = _finish_probe(key.fileobj)
+            finally:
+                # Anything still registered timed out and stays "filtered"
+                for key in list(sel.get_map().values()):
+                    sel.unregister(key.fileobj)
+                    key.fileobj.close()
+
+        yield statuses
+
+
+def _select_statuses(
+    ip: str,
+    ports: Sequence[int],
+    timeout: float,
+    chunk: int,
+) -> List[str]:
+    """
+    Probe ports from a single thread with non-blocking connects.
+
+    Args:
+        ip: The resolved IP address to scan
+        ports: Sequence of port numbers to scan
+        timeout: Socket timeout in seconds
+        chunk: Number of connections in flight at once
+
+    Returns:
+        The status of each port, in the same order as ``ports``
+    """
+    statuses: List[str] = []
+    for chunk_statuses in _iter_select_chunks(ip, ports, timeout, chunk):
+        statuses.extend(chunk_statuses)
+    return statuses
+
+
+def _executor_statuses(
+    ip: str,
+    ports: Sequence[int],
+    timeout: float,
+    max_workers: int,
+    executor: Executor,
+) -> List[str]:
+    """
+    Probe ports with blocking connects on a caller-supplied executor.
+
+    At most ``max_workers * 2`` probes are queued on the executor at once;
+    each completion submits the next port, so the number of live futures
+    stays bounded however many ports are scanned.
+
+    Args:
+        ip: The resolved IP address to scan
+        ports: Sequence of port numbers to scan
+        timeout: Socket timeout in seconds
+        max_workers: Maximum number of concurrent connections
+        executor: Executor to run the per-port probes on
+
+    Returns:
+        The status of each port, in the same order as ``ports``
+    """
+    # Written by position, so results come back in input order unsorted
+    statuses: List[str] = ["closed"] * len(ports)
+    future_to_index: Dict[Future, int] = {}
+    done: "queue.SimpleQueue[Future]" = queue.SimpleQueue()
+    port_iter = iter(enumerate(ports))
+
+    def submit(index: int, port: int) -> None:
+        future = executor.submit(scan_single_port, ip, port, timeout, (ip, port))
+        future_to_index[future] = index
+        future.add_done_callback(done.put)
+
+    for index, port in islice(port_iter, max(1, max_workers) * 2):
+        submit(index, port)
+
+    # Collect results as they complete, topping the window back up
+    while future_to_index:
+        future = done.get()
+        index = future_to_index.pop(future)
+        try:
+            statuses[index] = future.result()["status"]
+        except Exception:
+            # If individual scan fails, leave it marked closed
+            pass
+
+        for index, port in islice(port_iter, 1):
+            submit(index, port)
+
+    return statuses
+
+
+def _build_results(
+    ports: Sequence[int],
+    statuses: List[str],
+) -> List[ScanResult]:
+    """
+    Materialize per-port ScanResult dictionaries from parallel arrays.
+
+    Args:
+        ports: Sequence of port numbers that were scanned
+        statuses: The status of each port, in the same order as ``ports``
+
+    Returns:
+        A list of ScanResult dictionaries sorted by port number
+    """
+    if ports is TOP_PORTS:
+        # Already sorted, with services known by position
+        return [
+            {
+                "port": port,
+                "status": status,
+                "service": service if status == "open" else None,
+            }
+            for port, status, service in zip(TOP_PORTS, statuses, TOP_SERVICES)
+        ]
+
+    results: List[ScanResult] = [
+        {
+            "port": port,
+            "status": status,
+            "service": get_service_name(port) if status == "open" else None,
+        }
+        for port, status in zip(ports, statuses)
+    ]
+
+    # Sort results by port number
+    results.sort(key=itemgetter("port"))
+    return results
+
+
+def scan_ports_select(
+    host: str,
+    ports: Sequence[int],
+    timeout: float = 0.5,
+    chunk: int = 1024,
+) -> List[ScanResult]:
+    """
+    Scan multiple ports from a single thread with non-blocking connects.
 
-    return result
+    Connects are fired on up to ``chunk`` non-blocking sockets at once and
+    the writable ones are harvested with a selector (epoll on Linux, so more
+    than 1024 descriptors are fine), giving one kernel wait per chunk
+    instead of one per port.
+
+    Args:
+        host: The hostname or IP address to scan
+        ports: Sequence of port numbers to scan
+        timeout: Socket timeout in seconds (default: 0.5)
+        chunk: Number of connections in flight at once (default: 1024)
+
+    Returns:
+        A list of ScanResult dictionaries, one for each port scanned
+
+    Raises:
+        socket.gaierror: If the hostname cannot be resolved
+    """
+    return _build_results(
+        ports, _select_statuses(_resolve(host), ports, timeout, chunk)
+    )
+
+
+def _probe_ports(
+    host: str,
+    ports: Sequence[int],
+    timeout: float,
+    max_workers: int,
+    executor: Optional[Executor] = None,
+    method: str = "connect",
+) -> List[str]:
+    """
+    Probe ports with the best backend available on this system.
+
+    Connections are multiplexed on a single asyncio event loop rather than
+    one thread per port, so large port ranges do not pay for thread stacks
+    and context switches. On Linux, when the optional liburing bindings are
+    available, connects are batched through io_uring instead; otherwise
+    large worker counts (256 and up) use the single-threaded selector scan,
+    as do calls made while an event loop is already running in this thread.
+    A caller-supplied executor takes precedence over all of these, so a
+    long-lived process can reuse its worker threads across scans.
+
+    With ``method="syn"`` ports are probed with raw SYN segments when the
+    process may open raw sockets (CAP_NET_RAW on Linux), falling back to
+    connect scanning otherwise.
+
+    Args:
+        host: The hostname or IP address to scan
+        ports: Sequence of port numbers to scan
+        timeout: Socket timeout in seconds
+        max_workers: Maximum number of concurrent connections
+        executor: Optional executor to run blocking per-port probes on
+        method: "connect" for full TCP connects, or "syn" for SYN scanning
+
+    Returns:
+        The status of each port, in the same order as ``ports``
+
+    Raises:
+        socket.gaierror: If the hostname cannot be resolved
+        ValueError: If the scan method is unknown
+    """
+    if method not in SCAN_METHODS:
+        raise ValueError(
+            f"Invalid scan method: {method}. "
+            f"Must be one of: {', '.join(SCAN_METHODS)}"
+        )
+
+    if method == "syn" and scanner_syn.is_supported():
+        return scanner_syn.probe_ports_syn(
+            _resolve(host), ports, timeout, max_workers
+        )
+
+    if executor is not None:
+        return _executor_statuses(
+            _resolve(host), ports, timeout, max_workers, executor
+        )
+
+    if sys.platform == "linux" and scanner_iouring.is_supported():
+        return scanner_iouring.probe_ports_iouring(
+            _resolve(host), ports, timeout, max_workers
+        )
+
+    if max_workers >= SELECT_MIN_WORKERS:
+        return _select_statuses(_resolve(host), ports, timeout, max_workers)
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(_scan_all(host, ports, timeout, max_workers))
+
+    # asyncio.run() cannot nest inside the caller's event loop
+    return _select_statuses(_resolve(host), ports, timeout, max_workers)
+
+
+def _scan_ports_soa(
+    host: str,
+    ports: Sequence[int],
+    timeout: float,
+    max_workers: int,
+    executor: Optional[Executor] = None,
+    method: str = "connect",
+) -> Tuple[array, List[Optional[str]]]:
+    """
+    Scan ports and return only the open ones as parallel arrays.
+
+    Closed ports never become dictionaries, which keeps large scans from
+    allocating a result object per port only to discard it.
+
+    Args:
+        host: The hostname or IP address to scan
+        ports: Sequence of port numbers to scan
+        timeout: Socket timeout in seconds
+        max_workers: Maximum number of concurrent connections
+        executor: Optional executor to run blocking per-port probes on
+        method: "connect" for full TCP connects, or "syn" for SYN scanning
+
+    Returns:
+        A tuple of the sorted open port numbers and their service names
+
+    Raises:
+        socket.gaierror: If the hostname cannot be resolved
+        ValueError: If the scan method is unknown
+    """
+    statuses = _probe_ports(host, ports, timeout, max_workers, executor, method)
+
+    if ports is TOP_PORTS:
+        # Already sorted, with services known by position
+        hits = [i for i, status in enumerate(statuses) if status == "open"]
+        return (
+            array("H", [TOP_PORTS[i] for i in hits]),
+            [TOP_SERVICES[i] for i in hits],
+        )
+
+    open_ports = array(
+        "H",
+        sorted(port for port, status in zip(ports, statuses) if status == "open"),
+    )
+    services = [get_service_name(port) for port in open_ports]
+    return open_ports, services
 
 
 def scan_ports(
     host: str,
-    ports: List[int],
+    ports: Sequence[int],
     timeout: float = 0.5,
     max_workers: int = 100,
+    executor: Optional[Executor] = None,
+    method: str = "connect",
 ) -> List[ScanResult]:
     """
     Scan multiple ports on a host using concurrent connections.
 
     Args:
         host: The hostname or IP address to scan
-        ports: List of port numbers to scan
+        ports: Sequence of port numbers to scan
         timeout: Socket timeout in seconds (default: 0.5)
-        max_workers: Maximum number of concurrent worker threads (default: 100)
+        max_workers: Maximum number of concurrent connections (default: 100)
+        executor: Optional executor to reuse for the per-port probes instead
+            of setting up a new event loop for this scan
+        method: "connect" (default) for full TCP connects, or "syn" for raw
+            SYN scanning when raw sockets are available on Linux
 
     Returns:
         A list of ScanResult dictionaries, one for each port scanned
 
     Raises:
         socket.gaierror: If the hostname cannot be resolved
+        ValueError: If the scan method is unknown
     """
-    # First, verify the host is resolvable
-    try:
-        socket.gethostbyname(host)
-    except socket.gaierror as e:
-        raise socket.gaierror(f"Cannot resolve hostname: {host}") from e
+    return _build_results(
+        ports, _probe_ports(host, ports, timeout, max_workers, executor, method)
+    )
 
-    results: List[ScanResult] = []
 
-    # Use ThreadPoolExecutor for concurrent scanning
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        # Submit all port scan tasks
-        future_to_port = {
-            executor.submit(scan_single_port, host, port, timeout): port
-            for port in ports
-        }
+def scan_open_ports(
+    host: str,
+    ports: Sequence[int],
+    timeout: float = 0.5,
+    max_workers: int = 100,
+    executor: Optional[Executor] = None,
+    method: str = "connect",
+) -> List[ScanResult]:
+    """
+    Scan multiple ports on a host and return results for open ports only.
 
-        # Collect results as they complete
-        for future in as_completed(future_to_port):
-            try:
-                result = future.result()
-                results.append(result)
-            except Exception:
-                # If individual scan fails, skip it
-                port = future_to_port[future]
-                results.append({
+    Args:
+        host: The hostname or IP address to scan
+        ports: Sequence of port numbers to scan
+        timeout: Socket timeout in seconds (default: 0.5)
+        max_workers: Maximum number of concurrent connections (default: 100)
+        executor: Optional executor to reuse for the per-port probes instead
+            of setting up a new event loop for this scan
+        method: "connect" (default) for full TCP connects, or "syn" for raw
+            SYN scanning when raw sockets are available on Linux
+
+    Returns:
+        A list of ScanResult dictionaries for the open ports, sorted by port
+
+    Raises:
+        socket.gaierror: If the hostname cannot be resolved
+        ValueError: If the scan method is unknown
+    """
+    open_ports, services = _scan_ports_soa(
+        host, ports, timeout, max_workers, executor, method
+    )
+    return [
+        {"port": port, "status": "open", "service": service}
+        for port, service in zip(open_ports, services)
+    ]
+
+
+def stream_open_ports(
+    host: str,
+    ports: Sequence[int],
+    timeout: float = 0.5,
+    max_workers: int = 100,
+    executor: Optional[Executor] = None,
+) -> Iterator[ScanResult]:
+    """
+    Scan ports and yield results for open ports as each chunk completes.
+
+    Ports are probed in ascending order, ``max_workers`` at a time, so
+    results come out sorted by port while the scan is still running and
+    nothing has to be held until the end.
+
+    Args:
+        host: The hostname or IP address to scan
+        ports: Sequence of port numbers to scan
+        timeout: Socket timeout in seconds (default: 0.5)
+        max_workers: Maximum number of concurrent connections (default: 100)
+        executor: Optional executor to run blocking per-port probes on,
+            e.g. a pool shared across requests (default: non-blocking
+            connects from the calling thread)
+
+    Yields:
+        ScanResult dictionaries for the open ports, in ascending port order
+
+    Raises:
+        socket.gaierror: If the hostname cannot be resolved
+    """
+    ip = _resolve(host)
+    if ports is not TOP_PORTS:
+        ports = sorted(ports)
+
+    chunk = max(1, max_workers)
+    if executor is None:
+        chunks = _iter_select_chunks(ip, ports, timeout, chunk)
+    else:
+        chunks = (
+            _executor_statuses(
+                ip, ports[start:start + chunk], timeout, max_workers, executor
+            )
+            for start in range(0, len(ports), chunk)
+        )
+
+    start = 0
+    for statuses in chunks:
+        for port, status in zip(ports[start:start + chunk], statuses):
+            if status == "open":
+                yield {
                     "port": port,
-                    "status": "closed",
-                    "service": None,
-                })
+                    "status": "open",
+                    "service": get_service_name(port),
+                }
+        start += chunk
 
-    # Sort results by port number
-    results.sort(key=lambda x: x["port"])
-    return results
 
+def _plain_spec_bitmap(port_spec: str) -> Optional[bytearray]:
+    """
+    Build a port bitmap for a specification of only digits, commas and hyphens.
+
+    Args:
+        port_spec: The port specification string
+
+    Returns:
+        One flag per port number, or None if the specification contains any
+        other character or a part that is malformed or out of range
+    """
+    if not _PLAIN_SPEC_CHARS.issuperset(port_spec):
+        return None
+
+    bitmap = bytearray(65536)
 
-def parse_ports(port_spec: str) -> List[int]:
+    for part in port_spec.split(","):
+        start, sep, end = part.partition("-")
+        if not start.isdigit():
+            return None
+
+        if not sep:
+            port = int(start)
+            if port < 1 or port > 65535:
+                return None
+            bitmap[port] = 1
+            continue
+
+        if not end.isdigit():
+            return None
+        first, last = int(start), int(end)
+        if first < 1 or last > 65535 or first > last:
+            return None
+        bitmap[first:last + 1] = _ONES[:last - first + 1]
+
+    return bitmap
+
+
+def _bitmap_to_runs(bitmap: bytearray) -> bytes:
     """
-    Parse a port specification string into a list of port numbers.
+    Collect the runs of set positions in a port bitmap.
+
+    Runs of set bytes are located with ``bytearray.find``, so the work done
+    in Python is proportional to the number of ranges rather than to 65536.
+
+    Args:
+        bitmap: A 65536-byte bitmap with 1 at each selected port
+
+    Returns:
+        The first and last port of each run, in ascending order, packed as
+        native unsigned shorts
+    """
+    runs = array("H")
+
+    start = bitmap.find(1)
+    while start != -1:
+        end = bitmap.find(0, start)
+        if end == -1:
+            end = len(bitmap)
+        runs.append(start)
+        runs.append(end - 1)
+        start = bitmap.find(1, end)
+
+    return runs.tobytes()
+
+
+def parse_ports(port_spec: str) -> Tuple[int, ...]:
+    """
+    Parse a port specification string into a tuple of port numbers.
 
     Supports:
     - Single port: "80"
@@ -130,50 +775,80 @@ def parse_ports(port_spec: str) -> List[int]:
         port_spec: The port specification string
 
     Returns:
-        A sorted list of unique port numbers
+        A sorted tuple of unique port numbers
 
     Raises:
         ValueError: If the port specification is invalid
     """
-    ports: Set[int] = set()
+    if len(port_spec) <= _MAX_CACHED_SPEC_LEN:
+        packed = _parse_port_runs(port_spec)
+    else:
+        packed = _parse_port_runs.__wrapped__(port_spec)
+    runs = memoryview(packed).cast("H")
 
-    # Split by comma
-    parts = port_spec.split(",")
+    ports: List[int] = []
+    for first, last in zip(runs[::2], runs[1::2]):
+        ports.extend(range(first, last + 1))
+
+    return tuple(ports)
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_port_runs(port_spec: str) -> bytes:
+    """
+    Parse a port specification string into runs of consecutive ports.
+
+    Results are cached per specification string, since the same specs
+    ("1-1024", "22,80,443") are submitted over and over. Only the runs are
+    cached, so an entry costs a few bytes per range however many ports it
+    covers; ``parse_ports`` bypasses the cache for specifications longer
+    than ``_MAX_CACHED_SPEC_LEN``.
+
+    Args:
+        port_spec: The port specification string
 
-    for part in parts:
+    Returns:
+        The runs of selected ports, as packed by ``_bitmap_to_runs``
+
+    Raises:
+        ValueError: If the port specification is invalid
+    """
+    # Plain specs skip the regex; anything irregular is re-parsed below so
+    # it gets the detailed error
+    bitmap = _plain_spec_bitmap(port_spec)
+    if bitmap is not None:
+        return _bitmap_to_runs(bitmap)
+
+    # One flag per port number; ranges are filled with a single slice
+    bitmap = bytearray(65536)
+
+    for part in port_spec.split(","):
+        match = _PORT_PART_RE.fullmatch(part)
         part = part.strip()
 
-        if "-" in part:
-            # Handle range
-            try:
-                start_str, end_str = part.split("-", 1)
-                start = int(start_str.strip())
-                end = int(end_str.strip())
-
-                if start < 1 or end > 65535 or start > end:
-                    raise ValueError(
-                        f"Invalid port range: {part}. "
-                        "Ports must be 1-65535 and start <= end."
-                    )
-
-                ports.update(range(start, end + 1))
-            except ValueError as e:
-                if "invalid literal" in str(e):
-                    raise ValueError(f"Invalid port range format: {part}") from e
-                raise
-        else:
+        if match is None:
+            if "-" in part:
+                raise ValueError(f"Invalid port range format: {part}")
+            raise ValueError(f"Invalid port number: {part}")
+
+        start = int(match[1])
+
+        if match[2] is None:
             # Handle single port
-            try:
-                port = int(part)
-                if port < 1 or port > 65535:
-                    raise ValueError(
-                        f"Invalid port number: {port}. "
-                        "Ports must be 1-65535."
-                    )
-                ports.add(port)
-            except ValueError as e:
-                if "invalid literal" in str(e):
-                    raise ValueError(f"Invalid port number: {part}") from e
-                raise
-
-    return sorted(list(ports))
+            if start < 1 or start > 65535:
+                raise ValueError(
+                    f"Invalid port number: {start}. "
+                    "Ports must be 1-65535."
+                )
+            bitmap[start] = 1
+        else:
+            # Handle range
+            end = int(match[2])
+            if start < 1 or end > 65535 or start > end:
+                raise ValueError(
+                    f"Invalid port range: {part}. "
+                    "Ports must be 1-65535 and start <= end."
+                )
+            bitmap[start:end + 1] = _ONES[:end - start + 1]
+
+    return _bitmap_to_runs(bitmap)
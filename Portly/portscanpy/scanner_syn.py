@@ -0,0 +1,222 @@
+"""
+Raw SYN ("half-open") scanning backend.
+
+Instead of completing a TCP handshake per port, this backend writes bare SYN
+segments on a single raw socket and classifies ports from the replies: a
+SYN-ACK means open, a RST means closed, and silence means filtered. The
+kernel answers the SYN-ACK with a RST itself, since no local socket owns the
+connection, so no per-port sockets or TIME_WAIT entries are created.
+
+Raw sockets need CAP_NET_RAW and the reply filter is Linux-specific;
+``is_supported()`` reports whether this backend can be used.
+"""
+
+import ctypes
+import random
+import selectors
+import socket
+import struct
+import sys
+import time
+from typing import Dict, List, Optional, Sequence
+
+# TCP header flags
+_SYN = 0x02
+_RST = 0x04
+_ACK = 0x10
+
+# Not exported by the socket module
+_SO_ATTACH_FILTER = 26
+
+# Classic BPF opcodes used by the reply filter
+_BPF_LD_W_ABS = 0x20
+_BPF_LD_H_IND = 0x48
+_BPF_LDX_B_MSH = 0xB1
+_BPF_JEQ_K = 0x15
+_BPF_RET_K = 0x06
+
+# Large enough to absorb a burst of replies while SYNs are still being sent
+_RECV_BUFFER_SIZE = 4 * 1024 * 1024
+
+_supported: Optional[bool] = None
+
+
+def is_supported() -> bool:
+    """
+    Check whether raw SYN scanning is available to this process.
+
+    The probe opens and closes a raw TCP socket once; the answer is cached.
+    This follows CAP_NET_RAW rather than the user id, so root in a container
+    without the capability is refused and capable non-root processes are
+    accepted.
+
+    Returns:
+        True on Linux when the process may open raw sockets
+    """
+    global _supported
+
+    if _supported is None:
+        if sys.platform != "linux":
+            _supported = False
+        else:
+            try:
+                socket.socket(
+                    socket.AF_INET, socket.SOCK_RAW, socket.IPPROTO_TCP
+                ).close()
+                _supported = True
+            except OSError:
+                _supported = False
+
+    return _supported
+
+
+def _checksum(data: bytes) -> int:
+    """Compute the Internet checksum (RFC 1071) of ``data``."""
+    if len(data) % 2:
+        data += b"\0"
+    total = sum(struct.unpack(f"!{len(data) // 2}H", data))
+    while total >> 16:
+        total = (total & 0xFFFF) + (total >> 16)
+    return ~total & 0xFFFF
+
+
+def _syn_segment(src: bytes, dst: bytes, sport: int, dport: int, seq: int) -> bytes:
+    """
+    Build a 20-byte TCP SYN segment with a valid checksum.
+
+    Args:
+        src: Packed source IPv4 address
+        dst: Packed destination IPv4 address
+        sport: Source port
+        dport: Destination port
+        seq: Initial sequence number
+
+    Returns:
+        The TCP header, ready to send on a raw IPPROTO_TCP socket
+    """
+    header = struct.pack("!HHIIBBHHH", sport, dport, seq, 0, 5 << 4, _SYN, 1024, 0, 0)
+    pseudo = src + dst + struct.pack("!BBH", 0, socket.IPPROTO_TCP, len(header))
+    return header[:16] + struct.pack("!H", _checksum(pseudo + header)) + header[18:]
+
+
+def _attach_reply_filter(sock: socket.socket, dst: bytes, sport: int) -> None:
+    """
+    Attach a BPF filter passing only TCP segments from ``dst`` to ``sport``.
+
+    Without it the raw socket would be woken for every TCP segment the host
+    receives. Matching is still repeated in Python, so the filter is purely
+    an optimisation.
+
+    Args:
+        sock: The raw IPPROTO_TCP socket
+        dst: Packed IPv4 address of the scan target
+        sport: Source port used by the probes
+    """
+    program = [
+        (_BPF_LD_W_ABS, 0, 0, 12),                           # A = ip.saddr
+        (_BPF_JEQ_K, 0, 4, struct.unpack("!I", dst)[0]),      # != target -> drop
+        (_BPF_LDX_B_MSH, 0, 0, 0),                           # X = ip header length
+        (_BPF_LD_H_IND, 0, 0, 2),                            # A = tcp.dport
+        (_BPF_JEQ_K, 0, 1, sport),                           # != sport -> drop
+        (_BPF_RET_K, 0, 0, 0xFFFF),                          # accept
+        (_BPF_RET_K, 0, 0, 0),                               # drop
+    ]
+    insns = ctypes.create_string_buffer(
+        b"".join(struct.pack("HBBI", *insn) for insn in program)
+    )
+    fprog = struct.pack("HL", len(program), ctypes.addressof(insns))
+    # The kernel copies the program, so the buffer only has to outlive this call
+    sock.setsockopt(socket.SOL_SOCKET, _SO_ATTACH_FILTER, fprog)
+
+
+def _source_address(ip: str) -> str:
+    """Return the local address the kernel would route ``ip`` from."""
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as probe:
+        probe.connect((ip, 9))
+        return probe.getsockname()[0]
+
+
+def probe_ports_syn(
+    ip: str,
+    ports: Sequence[int],
+    timeout: float,
+    max_workers: int,
+) -> List[str]:
+    """
+    Probe ports on an already-resolved IPv4 address with raw SYN segments.
+
+    SYNs are sent in bursts of ``max_workers``, draining any replies that
+    have arrived between bursts; after the last burst replies are collected
+    until ``timeout`` seconds pass without all ports having answered.
+
+    Args:
+        ip: The resolved IPv4 address to scan
+        ports: Sequence of port numbers to scan
+        timeout: Seconds to wait for replies after the last SYN is sent
+        max_workers: Number of SYNs sent per burst
+
+    Returns:
+        The status of each port ("open", "closed" or "filtered"), in the
+        same order as ``ports``
+
+    Raises:
+        PermissionError: If the process may not open raw sockets
+    """
+    src = socket.inet_aton(_source_address(ip))
+    dst = socket.inet_aton(ip)
+    sport = random.randint(32768, 60999)
+    seq = random.getrandbits(32)
+    expected_ack = (seq + 1) & 0xFFFFFFFF
+
+    statuses: Dict[int, str] = {}
+    pending = set(ports)
+    burst = max(1, max_workers)
+
+    sock = socket.socket(socket.AF_INET, socket.SOCK_RAW, socket.IPPROTO_TCP)
+    with sock, selectors.DefaultSelector() as sel:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, _RECV_BUFFER_SIZE)
+        _attach_reply_filter(sock, dst, sport)
+        sock.setblocking(False)
+        sel.register(sock, selectors.EVENT_READ)
+
+        def drain() -> None:
+            while pending:
+                try:
+                    packet = sock.recv(128)
+                except BlockingIOError:
+                    return
+
+                ihl = (packet[0] & 0x0F) * 4
+                if packet[12:16] != dst or len(packet) < ihl + 14:
+                    continue
+                reply_sport, reply_dport, _, ack = struct.unpack_from(
+                    "!HHII", packet, ihl
+                )
+                flags = packet[ihl + 13]
+                if reply_dport != sport or reply_sport not in pending:
+                    continue
+                # Both SYN-ACK and RST acknowledge our SYN; anything else is
+                # stale or belongs to another connection using this sport
+                if ack != expected_ack:
+                    continue
+
+                if flags & (_SYN | _ACK) == _SYN | _ACK:
+                    pending.discard(reply_sport)
+                    statuses[reply_sport] = "open"
+                elif flags & _RST:
+                    pending.discard(reply_sport)
+                    statuses[reply_sport] = "closed"
+
+        for start in range(0, len(ports), burst):
+            for port in ports[start:start + burst]:
+                sock.sendto(_syn_segment(src, dst, sport, port, seq), (ip, 0))
+            drain()
+
+        deadline = time.monotonic() + timeout
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not sel.select(remaining):
+                break
+            drain()
+
+    return [statuses.get(port, "filtered") for port in ports]
@@ -5,7 +5,7 @@ This module provides a dictionary mapping well-known port numbers to their
 corresponding service names, useful for annotating port scan results.
 """
 
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 
 COMMON_PORTS: Dict[int, str] = {
     20: "ftp-data",
@@ -35,6 +35,17 @@ COMMON_PORTS: Dict[int, str] = {
     27017: "mongodb",
 }
 
+# The common ports as a ready-made scan target, with services by position.
+# Scanners recognise this exact tuple and skip per-port service lookups.
+TOP_PORTS: Tuple[int, ...] = tuple(sorted(COMMON_PORTS))
+TOP_SERVICES: Tuple[str, ...] = tuple(COMMON_PORTS[port] for port in TOP_PORTS)
+
+# Flat port-indexed lookup table, so service lookup is a plain index with
+# no hashing on the per-port path
+_SERVICE_TABLE: Tuple[Optional[str], ...] = tuple(
+    COMMON_PORTS.get(port) for port in range(65536)
+)
+
 
 def get_service_name(port: int) -> Optional[str]:
     """
@@ -46,4 +57,6 @@ def get_service_name(port: int) -> Optional[str]:
     Returns:
         The service name if known, otherwise None
     """
-    return COMMON_PORTS.get(port)
+    if 0 <= port < 65536:
+        return _SERVICE_TABLE[port]
+    return None
@@ -0,0 +1,49 @@
+"""
+Shared fixtures for the PortScanPy test suite.
+
+Scans are run against real sockets on 127.0.0.1 so every backend sees
+genuine SYN-ACK and RST replies.
+"""
+
+import contextlib
+import socket
+from typing import Iterator
+
+
+@contextlib.contextmanager
+def listening_port() -> Iterator[int]:
+    """Yield a localhost port with a listening socket behind it."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as server:
+        server.bind(("127.0.0.1", 0))
+        server.listen()
+        yield server.getsockname()[1]
+
+
+@contextlib.contextmanager
+def closed_port() -> Iterator[int]:
+    """Yield a localhost port that is bound but refuses connections."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as unused:
+        unused.bind(("127.0.0.1", 0))
+        yield unused.getsockname()[1]
+
+
+@contextlib.contextmanager
+def saturated_port() -> Iterator[int]:
+    """Yield a localhost port whose full backlog makes connects time out."""
+    with contextlib.ExitStack() as stack:
+        server = stack.enter_context(
+            socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        )
+        server.bind(("127.0.0.1", 0))
+        server.listen(0)
+        port = server.getsockname()[1]
+
+        # Fill the accept queue with connections that are never accepted
+        for _ in range(4):
+            client = stack.enter_context(
+                socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            )
+            client.setblocking(False)
+            client.connect_ex(("127.0.0.1", port))
+
+        yield port
@@ -4,12 +4,29 @@ Unit tests for PortScanPy scanner module.
 These tests verify port parsing logic and basic scanning functionality.
 """
 
+import asyncio
+import contextlib
+import selectors
 import socket
+import struct
+import threading
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import patch, MagicMock
 
-from portscanpy.scanner import parse_ports, scan_ports, scan_single_port
-from portscanpy.services import get_service_name
+from portscanpy import scanner, scanner_iouring, scanner_syn
+from portscanpy.scanner import (
+    _parse_port_runs,
+    parse_ports,
+    scan_open_ports,
+    scan_ports,
+    scan_ports_select,
+    scan_single_port,
+    stream_open_ports,
+)
+from portscanpy.services import TOP_PORTS, TOP_SERVICES, get_service_name
+from portscanpy.sockopts import open_probe_socket, tune_probe_socket
+from tests.helpers import closed_port, listening_port, saturated_port
 
 
 class TestPortParsing(unittest.TestCase):
@@ -18,32 +35,32 @@ class TestPortParsing(unittest.TestCase):
     def test_single_port(self):
         """Test parsing a single port number."""
         result = parse_ports("80")
-        self.assertEqual(result, [80])
+        self.assertEqual(result, (80,))
 
     def test_comma_separated_ports(self):
         """Test parsing comma-separated port list."""
         result = parse_ports("80,443,8080")
-        self.assertEqual(result, [80, 443, 8080])
+        self.assertEqual(result, (80, 443, 8080))
 
     def test_port_range(self):
         """Test parsing a port range."""
         result = parse_ports("20-25")
-        self.assertEqual(result, [20, 21, 22, 23, 24, 25])
+        self.assertEqual(result, (20, 21, 22, 23, 24, 25))
 
     def test_mixed_specification(self):
         """Test parsing mixed port specification."""
         result = parse_ports("22,80-82,443")
-        self.assertEqual(result, [22, 80, 81, 82, 443])
+        self.assertEqual(result, (22, 80, 81, 82, 443))
 
     def test_ports_with_spaces(self):
         """Test parsing ports with extra whitespace."""
         result = parse_ports("22, 80 - 82 , 443")
-        self.assertEqual(result, [22, 80, 81, 82, 443])
+        self.assertEqual(result, (22, 80, 81, 82, 443))
 
     def test_duplicate_ports(self):
         """Test that duplicate ports are handled correctly."""
         result = parse_ports("80,80,80")
-        self.assertEqual(result, [80])
+        self.assertEqual(result, (80,))
 
     def test_invalid_port_number(self):
         """Test that invalid port numbers raise ValueError."""
@@ -65,6 +82,47 @@ class TestPortParsing(unittest.TestCase):
         with self.assertRaises(ValueError):
             parse_ports("abc")
 
+    def test_invalid_range_format(self):
+        """Test that malformed ranges raise ValueError."""
+        with self.assertRaises(ValueError):
+            parse_ports("1-2-3")
+
+    def test_plain_spec_errors_are_detailed(self):
+        """Test that plain specs report the same errors as spaced ones."""
+        with self.assertRaisesRegex(ValueError, "Invalid port range: 5-1"):
+            parse_ports("5-1")
+        with self.assertRaisesRegex(ValueError, "Invalid port range format: 5-"):
+            parse_ports("5-")
+        with self.assertRaisesRegex(ValueError, "Invalid port number: 65536"):
+            parse_ports("80,65536")
+
+    def test_overlapping_ranges_and_last_port(self):
+        """Test that overlapping ranges merge and port 65535 is kept."""
+        result = parse_ports("10-12,11-13,65535")
+        self.assertEqual(result, (10, 11, 12, 13, 65535))
+
+    def test_full_port_range(self):
+        """Test parsing the full port range."""
+        result = parse_ports("1-65535")
+        self.assertEqual(result, tuple(range(1, 65536)))
+
+    def test_cache_holds_ranges_not_ports(self):
+        """Test that parsed specs are cached as compact port runs."""
+        parse_ports("1-65535")
+        hits = _parse_port_runs.cache_info().hits
+
+        self.assertEqual(parse_ports("1-65535"), tuple(range(1, 65536)))
+        self.assertEqual(_parse_port_runs.cache_info().hits, hits + 1)
+        self.assertEqual(len(_parse_port_runs("1-65535")), 4)
+
+    def test_long_specs_are_not_cached(self):
+        """Test that oversized specifications bypass the parse cache."""
+        spec = ",".join(["80"] * 1000)
+        size = _parse_port_runs.cache_info().currsize
+
+        self.assertEqual(parse_ports(spec), (80,))
+        self.assertEqual(_parse_port_runs.cache_info().currsize, size)
+
 
 class TestServiceLookup(unittest.TestCase):
     """Test cases for service name lookup."""
@@ -79,6 +137,35 @@ class TestServiceLookup(unittest.TestCase):
         """Test lookup of an unknown service."""
         self.assertIsNone(get_service_name(12345))
 
+    def test_out_of_range_port(self):
+        """Test lookup of ports outside the valid range."""
+        self.assertIsNone(get_service_name(-1))
+        self.assertIsNone(get_service_name(65536))
+
+
+class TestProbeSocketOptions(unittest.TestCase):
+    """Test cases for probe socket tuning."""
+
+    def test_abortive_close_and_nodelay(self):
+        """Test that probe sockets linger 0 and disable Nagle."""
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            tune_probe_socket(sock)
+
+            linger = sock.getsockopt(socket.SOL_SOCKET, socket.SO_LINGER, 8)
+            nodelay = sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY)
+
+        self.assertEqual(struct.unpack("ii", linger), (1, 0))
+        self.assertTrue(nodelay)
+
+    def test_open_probe_socket_is_nonblocking_and_tuned(self):
+        """Test that probe sockets are opened non-blocking and tuned."""
+        with open_probe_socket() as sock:
+            linger = sock.getsockopt(socket.SOL_SOCKET, socket.SO_LINGER, 8)
+
+            self.assertEqual(sock.gettimeout(), 0.0)
+
+        self.assertEqual(struct.unpack("ii", linger), (1, 0))
+
 
 class TestScanSinglePort(unittest.TestCase):
     """Test cases for single port scanning."""
@@ -128,7 +215,21 @@ class TestScanSinglePort(unittest.TestCase):
         result = scan_single_port("localhost", 80, 0.1)
 
         self.assertEqual(result["port"], 80)
-        self.assertEqual(result["status"], "closed")
+        self.assertEqual(result["status"], "filtered")
+
+    @patch("socket.socket")
+    def test_prebuilt_address(self, mock_socket_class):
+        """Test that a prebuilt sockaddr is used instead of the hostname."""
+        mock_socket = MagicMock()
+        mock_socket.connect_ex.return_value = 0
+        mock_socket.__enter__ = MagicMock(return_value=mock_socket)
+        mock_socket.__exit__ = MagicMock(return_value=False)
+        mock_socket_class.return_value = mock_socket
+
+        result = scan_single_port("localhost", 22, 0.5, _addr=("127.0.0.1", 22))
+
+        mock_socket.connect_ex.assert_called_once_with(("127.0.0.1", 22))
+        self.assertEqual(result["status"], "open")
 
 
 class TestScanPorts(unittest.TestCase):
@@ -144,26 +245,309 @@ class TestScanPorts(unittest.TestCase):
         result = scan_ports("localhost", [], 0.5, 10)
         self.assertEqual(result, [])
 
-    @patch("portscanpy.scanner.scan_single_port")
-    @patch("socket.gethostbyname")
-    def test_results_sorted_by_port(self, mock_gethostbyname, mock_scan_single):
+    @patch("portscanpy.scanner.scanner_iouring.is_supported", return_value=False)
+    @patch("portscanpy.scanner._scan_one")
+    def test_results_sorted_by_port(self, mock_scan_one, mock_supported):
         """Test that results are sorted by port number."""
-        mock_gethostbyname.return_value = "127.0.0.1"
-
         # Mock scan results in random order
-        def mock_scan(host, port, timeout):
+        async def mock_scan(ip, port, timeout, sem):
+            return "closed"
+
+        mock_scan_one.side_effect = mock_scan
+
+        result = scan_ports("localhost", [443, 22, 80], 0.5, 10)
+
+        # Results should be sorted by port
+        self.assertEqual([r["port"] for r in result], [22, 80, 443])
+
+    @patch("portscanpy.scanner.scanner_iouring.is_supported", return_value=False)
+    def test_asyncio_backend_classifies_ports(self, mock_supported):
+        """Test the asyncio probes against real open, closed and filtered ports."""
+        with (
+            listening_port() as open_port,
+            closed_port() as closed,
+            saturated_port() as stalled,
+            patch("portscanpy.scanner._scan_one", wraps=scanner._scan_one) as probe,
+        ):
+            result = scan_ports("127.0.0.1", [open_port, closed, stalled], 0.2, 10)
+
+        statuses = {r["port"]: r["status"] for r in result}
+        self.assertEqual(
+            statuses,
+            {open_port: "open", closed: "closed", stalled: "filtered"},
+        )
+        self.assertEqual(probe.call_count, 3)
+
+    @patch("portscanpy.scanner.scanner_iouring.is_supported", return_value=False)
+    def test_scan_from_running_event_loop(self, mock_supported):
+        """Test that scanning works when called from inside a coroutine."""
+        async def scan_inside_loop(ports):
+            return scan_ports("127.0.0.1", ports, 0.5, 10)
+
+        with listening_port() as open_port, closed_port() as closed:
+            result = asyncio.run(scan_inside_loop([open_port, closed]))
+
+        statuses = {r["port"]: r["status"] for r in result}
+        self.assertEqual(statuses, {open_port: "open", closed: "closed"})
+
+    def test_detects_open_port(self):
+        """Test that a listening local port is reported as open."""
+        with listening_port() as open_port:
+            result = scan_ports("127.0.0.1", [open_port], 0.5, 10)
+
+        self.assertEqual(result, [{
+            "port": open_port,
+            "status": "open",
+            "service": get_service_name(open_port),
+        }])
+
+    @patch("portscanpy.scanner.scanner_iouring.is_supported", return_value=False)
+    @patch("portscanpy.scanner._select_statuses")
+    def test_many_workers_use_select_scan(self, mock_select, mock_supported):
+        """Test that large worker counts are routed to the selector scan."""
+        mock_select.return_value = ["closed"]
+
+        scan_ports("127.0.0.1", [80], 0.5, 512)
+
+        mock_select.assert_called_once_with("127.0.0.1", [80], 0.5, 512)
+
+    def test_shared_executor(self):
+        """Test that a caller-supplied executor runs the probes."""
+        with listening_port() as open_port:
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                result = scan_open_ports(
+                    "127.0.0.1", [open_port], 0.5, 10, executor=executor
+                )
+
+        self.assertEqual([r["port"] for r in result], [open_port])
+
+    def test_executor_statuses_match_other_backends(self):
+        """Test that the executor path reports open, closed and filtered."""
+        with (
+            listening_port() as open_port,
+            closed_port() as closed,
+            saturated_port() as stalled,
+            ThreadPoolExecutor(max_workers=4) as executor,
+        ):
+            result = scan_ports(
+                "127.0.0.1", [open_port, closed, stalled], 0.2, 10,
+                executor=executor,
+            )
+
+        statuses = {r["port"]: r["status"] for r in result}
+        self.assertEqual(
+            statuses,
+            {open_port: "open", closed: "closed", stalled: "filtered"},
+        )
+
+    @patch("portscanpy.scanner.scan_single_port")
+    def test_executor_window_is_bounded(self, mock_scan_single):
+        """Test that no more than max_workers * 2 probes are queued at once."""
+        class CountingExecutor(ThreadPoolExecutor):
+            lock = threading.Lock()
+            live = 0
+            peak = 0
+
+            def submit(self, fn, *args, **kwargs):
+                with CountingExecutor.lock:
+                    CountingExecutor.live += 1
+                    CountingExecutor.peak = max(CountingExecutor.peak, self.live)
+                future = super().submit(fn, *args, **kwargs)
+                future.add_done_callback(self._finished)
+                return future
+
+            @staticmethod
+            def _finished(future):
+                with CountingExecutor.lock:
+                    CountingExecutor.live -= 1
+
+        def mock_scan(ip, port, timeout, addr):
             return {
                 "port": port,
-                "status": "closed",
+                "status": "open" if port % 2 else "closed",
                 "service": None,
             }
 
         mock_scan_single.side_effect = mock_scan
 
-        result = scan_ports("localhost", [443, 22, 80], 0.5, 10)
+        with CountingExecutor(max_workers=2) as executor:
+            result = scan_ports(
+                "127.0.0.1", list(range(1, 51)), 0.5, 2, executor=executor
+            )
+
+        self.assertLessEqual(CountingExecutor.peak, 4)
+        self.assertEqual([r["port"] for r in result], list(range(1, 51)))
+        self.assertEqual(result[0]["status"], "open")
+        self.assertEqual(result[1]["status"], "closed")
+
+    @patch("portscanpy.scanner._probe_ports")
+    def test_top_ports_use_positional_services(self, mock_probe):
+        """Test that the top-ports scan takes services from TOP_SERVICES."""
+        statuses = ["closed"] * len(TOP_PORTS)
+        statuses[0] = statuses[-1] = "open"
+        mock_probe.return_value = statuses
+
+        open_results = scan_open_ports("127.0.0.1", TOP_PORTS, 0.5, 10)
+        all_results = scan_ports("127.0.0.1", TOP_PORTS, 0.5, 10)
+
+        expected = [
+            {"port": TOP_PORTS[0], "status": "open", "service": TOP_SERVICES[0]},
+            {"port": TOP_PORTS[-1], "status": "open", "service": TOP_SERVICES[-1]},
+        ]
+        self.assertEqual(open_results, expected)
+        self.assertEqual([r for r in all_results if r["status"] == "open"], expected)
+        self.assertEqual(len(all_results), len(TOP_PORTS))
+
+    def test_invalid_method(self):
+        """Test that an unknown scan method raises ValueError."""
+        with self.assertRaises(ValueError):
+            scan_ports("127.0.0.1", [80], 0.5, 10, method="xmas")
+
+    @patch("portscanpy.scanner.scanner_syn.is_supported", return_value=False)
+    def test_syn_falls_back_to_connect(self, mock_supported):
+        """Test that SYN scanning falls back to connects without privileges."""
+        with listening_port() as open_port:
+            result = scan_open_ports("127.0.0.1", [open_port], 0.5, 10, method="syn")
+
+        self.assertEqual([r["port"] for r in result], [open_port])
+
+    @patch("portscanpy.scanner_syn.sys.platform", "linux")
+    @patch("portscanpy.scanner_syn._supported", None)
+    @patch("portscanpy.scanner_syn.socket.socket", side_effect=PermissionError)
+    def test_syn_support_probes_raw_socket(self, mock_socket_class):
+        """Test that SYN support follows the ability to open a raw socket."""
+        self.assertFalse(scanner_syn.is_supported())
+        self.assertFalse(scanner_syn.is_supported())
+
+        mock_socket_class.assert_called_once_with(
+            socket.AF_INET, socket.SOCK_RAW, socket.IPPROTO_TCP
+        )
+
+    @patch("portscanpy.scanner._probe_ports")
+    def test_scan_open_ports_skips_closed(self, mock_probe):
+        """Test that only open ports are materialized, sorted by port."""
+        mock_probe.return_value = ["open", "closed", "filtered", "open"]
+
+        result = scan_open_ports("127.0.0.1", [443, 21, 8081, 22], 0.5, 10)
+
+        self.assertEqual(result, [
+            {"port": 22, "status": "open", "service": "ssh"},
+            {"port": 443, "status": "open", "service": "https"},
+        ])
+
+
+class TestScanPortsSelect(unittest.TestCase):
+    """Test cases for the selector-based scan."""
+
+    def test_open_and_closed_ports(self):
+        """Test that listening and refused ports are classified correctly."""
+        with listening_port() as open_port, closed_port() as closed:
+            result = scan_ports_select(
+                "127.0.0.1", [closed, open_port], 0.5, chunk=1
+            )
+
+        statuses = {r["port"]: r["status"] for r in result}
+        self.assertEqual(statuses, {open_port: "open", closed: "closed"})
+        self.assertEqual([r["port"] for r in result], sorted(statuses))
+
+    def test_unanswered_ports_are_filtered(self):
+        """Test that connects still pending at the deadline are filtered."""
+        # A socket with a full send buffer never becomes writable
+        stalled, peer = socket.socketpair()
+        self.addCleanup(peer.close)
+        stalled.setblocking(False)
+        try:
+            while True:
+                stalled.send(b"x" * 65536)
+        except BlockingIOError:
+            pass
+
+        def start_probe(ip, port, sel, data):
+            sel.register(stalled, selectors.EVENT_WRITE, data)
+            return None
+
+        with patch("portscanpy.scanner.scan_single_port_nb", side_effect=start_probe):
+            result = scan_ports_select("127.0.0.1", [80], 0.1)
+
+        self.assertEqual(result[0]["status"], "filtered")
+        self.assertEqual(stalled.fileno(), -1)
+
+    def test_stream_open_ports_in_port_order(self):
+        """Test that streamed open ports come out sorted across chunks."""
+        stack = contextlib.ExitStack()
+        self.addCleanup(stack.close)
+        servers = [stack.enter_context(listening_port()) for _ in range(3)]
+
+        ports = list(reversed(servers)) + [1]
+        result = list(stream_open_ports("127.0.0.1", ports, 0.5, 1))
+
+        self.assertEqual([r["port"] for r in result], sorted(servers))
+
+    def test_stream_open_ports_on_executor(self):
+        """Test that streaming can run its probes on a shared executor."""
+        stack = contextlib.ExitStack()
+        self.addCleanup(stack.close)
+        servers = [stack.enter_context(listening_port()) for _ in range(3)]
+
+        ports = list(reversed(servers)) + [1]
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            result = list(
+                stream_open_ports("127.0.0.1", ports, 0.5, 2, executor=executor)
+            )
+
+        self.assertEqual([r["port"] for r in result], sorted(servers))
 
-        # Results should be sorted by port
-        self.assertEqual([r["port"] for r in result], [22, 80, 443])
+    def test_invalid_host(self):
+        """Test that scanning an invalid host raises socket.gaierror."""
+        with self.assertRaises(socket.gaierror):
+            scan_ports_select("this-host-does-not-exist-12345.invalid", [80])
+
+
+@unittest.skipUnless(scanner_iouring.is_supported(), "io_uring not available")
+class TestScanPortsIouring(unittest.TestCase):
+    """Test cases for the io_uring scanning backend."""
+
+    def test_open_and_closed_ports(self):
+        """Test that listening and refused ports are classified correctly."""
+        with listening_port() as open_port, closed_port() as closed:
+            result = scanner_iouring.probe_ports_iouring(
+                "127.0.0.1", [open_port, closed], 0.5, 10
+            )
+
+        self.assertEqual(result, ["open", "closed"])
+
+    def test_batches_smaller_than_port_list(self):
+        """Test that ports are spread across several submission batches."""
+        result = scanner_iouring.probe_ports_iouring("127.0.0.1", [1, 2, 3], 0.5, 2)
+
+        self.assertEqual(result, ["closed", "closed", "closed"])
+
+
+@unittest.skipUnless(
+    scanner_syn.is_supported(), "raw sockets require CAP_NET_RAW on Linux"
+)
+class TestScanPortsSyn(unittest.TestCase):
+    """Test cases for the raw SYN scanning backend."""
+
+    def test_open_and_closed_ports(self):
+        """Test that SYN-ACK and RST replies are classified correctly."""
+        with listening_port() as open_port, closed_port() as closed:
+            result = scanner_syn.probe_ports_syn(
+                "127.0.0.1", [closed, open_port], 0.5, 1
+            )
+
+        self.assertEqual(result, ["closed", "open"])
+
+    def test_syn_segment_checksum(self):
+        """Test that a built SYN segment checksums to zero with its header."""
+        src = socket.inet_aton("10.0.0.1")
+        dst = socket.inet_aton("10.0.0.2")
+        segment = scanner_syn._syn_segment(src, dst, 40000, 80, 12345)
+        pseudo = src + dst + struct.pack("!BBH", 0, socket.IPPROTO_TCP, len(segment))
+
+        self.assertEqual(len(segment), 20)
+        self.assertEqual(segment[13], 0x02)
+        self.assertEqual(scanner_syn._checksum(pseudo + segment), 0)
 
 
 if __name__ == "__main__":
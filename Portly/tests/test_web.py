@@ -0,0 +1,134 @@
+"""
+Unit tests for the PortScanPy web API.
+
+These tests drive /api/scan through Flask's test client and parse the
+streamed response body.
+"""
+
+import json
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from tests.helpers import listening_port
+
+try:
+    from web.app import _MAX_TIMEOUT, _MAX_WORKERS, _MIN_TIMEOUT, app
+except ImportError:  # pragma: no cover - optional dependency
+    app = None
+
+
+@unittest.skipIf(app is None, "Flask is not installed")
+class TestScanEndpoint(unittest.TestCase):
+    """Test cases for the /api/scan endpoint."""
+
+    def setUp(self):
+        self.client = app.test_client()
+
+    def _scan(self, **payload):
+        response = self.client.post("/api/scan", json=payload)
+        return response, json.loads(response.get_data(as_text=True))
+
+    def test_streamed_body_is_valid_json(self):
+        """Test that the streamed document parses and reports open ports."""
+        with listening_port() as open_port:
+            response, body = self._scan(
+                target="127.0.0.1", ports=f"1,{open_port}", timeout=0.5
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(body["success"])
+        self.assertEqual(body["total_ports"], 2)
+        self.assertEqual([r["port"] for r in body["results"]], [open_port])
+        self.assertEqual(body["open_ports"], 1)
+        self.assertIn("scan_time_seconds", body)
+
+    @patch("web.app.stream_open_ports")
+    def test_scan_error_closes_document(self, mock_stream):
+        """Test that a failure mid-scan still yields valid JSON with an error."""
+        def failing_scan(*args, **kwargs):
+            yield {"port": 22, "status": "open", "service": "ssh"}
+            raise OSError(24, "Too many open files")
+
+        mock_stream.side_effect = failing_scan
+
+        _, body = self._scan(target="127.0.0.1", ports="1-1024")
+
+        self.assertFalse(body["success"])
+        self.assertIn("Too many open files", body["error"])
+        self.assertEqual([r["port"] for r in body["results"]], [22])
+        self.assertEqual(body["open_ports"], 1)
+
+    @patch("web.app.stream_open_ports")
+    def test_workers_are_capped(self, mock_stream):
+        """Test that the user-supplied worker count is clamped."""
+        mock_stream.return_value = iter(())
+
+        _, body = self._scan(target="127.0.0.1", ports="80", workers=100000)
+
+        self.assertTrue(body["success"])
+        self.assertEqual(mock_stream.call_args[0][3], _MAX_WORKERS)
+
+    @patch("web.app.stream_open_ports")
+    def test_timeout_is_clamped(self, mock_stream):
+        """Test that the user-supplied timeout is kept within bounds."""
+        mock_stream.return_value = iter(())
+
+        self._scan(target="127.0.0.1", ports="80", timeout=3600)
+        self.assertEqual(mock_stream.call_args[0][2], _MAX_TIMEOUT)
+
+        self._scan(target="127.0.0.1", ports="80", timeout=-1)
+        self.assertEqual(mock_stream.call_args[0][2], _MIN_TIMEOUT)
+
+    @patch("web.app.stream_open_ports")
+    def test_scan_runs_off_request_thread_and_stops(self, mock_stream):
+        """Test that the scan runs in the background and stops on disconnect."""
+        scan_threads = []
+        gate = threading.Event()
+        second_chunk_done = threading.Event()
+
+        def chunk_scan(ip, ports, *args, **kwargs):
+            scan_threads.append(threading.current_thread())
+            if len(scan_threads) > 1:
+                gate.wait(5)
+            yield {"port": ports[0], "status": "open", "service": None}
+            if len(scan_threads) == 2:
+                second_chunk_done.set()
+
+        mock_stream.side_effect = chunk_scan
+
+        response = self.client.post(
+            "/api/scan",
+            json={"target": "127.0.0.1", "ports": "1-1024", "workers": 8},
+            buffered=False,
+        )
+        body = iter(response.response)
+        next(body)  # header
+        next(body)  # first open port
+        response.close()
+
+        gate.set()
+        self.assertTrue(second_chunk_done.wait(5))
+        time.sleep(0.1)
+
+        self.assertNotIn(threading.current_thread(), scan_threads)
+        self.assertEqual(mock_stream.call_count, 2)
+
+    def test_json_provider_honours_dumps_options(self):
+        """Test that json.dumps options are not silently dropped."""
+        data = {"target": "example.com", "ports": [22, 80]}
+
+        self.assertEqual(app.json.dumps(data, indent=2), json.dumps(data, indent=2))
+        self.assertEqual(json.loads(app.json.dumps(data)), data)
+
+    def test_invalid_ports_rejected(self):
+        """Test that a bad port specification returns a 400 error."""
+        response, body = self._scan(target="127.0.0.1", ports="abc")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(body["success"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,20 +5,164 @@ Provides a web-based interface with an IDE-inspired aesthetic for
 running port scans and viewing results.
 """
 
+import json
 import os
+import queue
+import socket
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any, Dict, Sequence, Tuple, Union
 
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, Response, render_template, request, jsonify
+from flask.json.provider import JSONProvider
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
 
 # Add parent directory to path to import portscanpy
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from portscanpy.scanner import scan_ports, parse_ports
+from portscanpy.scanner import stream_open_ports, parse_ports
+
+
+class OrjsonProvider(JSONProvider):
+    """JSON provider backed by orjson for faster request/response encoding."""
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """
+        Serialize data as JSON with orjson.
+
+        orjson does not accept ``json.dumps`` options, so calls that pass
+        any (e.g. ``indent``) are serialized by the standard library
+        instead. Unlike ``json.dumps``, orjson writes non-ASCII text as
+        UTF-8 rather than ``\\uXXXX`` escapes.
+
+        Args:
+            obj: The data to serialize
+            **kwargs: Optional ``json.dumps`` arguments
+
+        Returns:
+            The JSON document as a string
+        """
+        if kwargs:
+            return json.dumps(obj, **kwargs)
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s: Union[str, bytes], **kwargs: Any) -> Any:
+        """
+        Deserialize JSON data with orjson.
+
+        As with ``dumps``, calls that pass ``json.loads`` options are
+        handled by the standard library.
+
+        Args:
+            s: The JSON document to parse
+            **kwargs: Optional ``json.loads`` arguments
+
+        Returns:
+            The parsed data
+        """
+        if kwargs:
+            return json.loads(s, **kwargs)
+        return orjson.loads(s)
+
 
 app = Flask(__name__)
 
+if orjson is not None:
+    app.json = OrjsonProvider(app)
+
+# Shared across requests so each scan skips thread pool and DNS setup
+_EXECUTOR_THREADS = 512
+_EXECUTOR = ThreadPoolExecutor(max_workers=_EXECUTOR_THREADS)
+
+# Bounds on the user-supplied scan settings. A scan keeps up to twice its
+# worker count queued on the shared executor, so one request can hold at
+# most a quarter of its threads, each for at most _MAX_TIMEOUT seconds.
+_MAX_WORKERS = _EXECUTOR_THREADS // 8
+_MIN_TIMEOUT = 0.1
+_MAX_TIMEOUT = 10.0
+
+# Runs each scan's chunk loop, so request threads only relay results. Kept
+# apart from _EXECUTOR so scans waiting on probes never starve the probes.
+_SCAN_EXECUTOR = ThreadPoolExecutor(max_workers=64)
+
+_RESOLVER_TTL = 30.0
+_RESOLVER_CACHE_MAX = 1024
+_RESOLVER_CACHE: Dict[str, Tuple[str, float]] = {}
+
+
+def _resolve_cached(host: str) -> str:
+    """
+    Resolve a hostname to an IPv4 address, caching answers for 30 seconds.
+
+    Args:
+        host: The hostname or IP address to resolve
+
+    Returns:
+        The resolved IPv4 address
+
+    Raises:
+        socket.gaierror: If the hostname cannot be resolved
+    """
+    now = time.monotonic()
+    cached = _RESOLVER_CACHE.get(host)
+    if cached is not None and cached[1] > now:
+        return cached[0]
+
+    try:
+        ip = socket.gethostbyname(host)
+    except socket.gaierror as e:
+        raise socket.gaierror(f"Cannot resolve hostname: {host}") from e
+
+    if len(_RESOLVER_CACHE) >= _RESOLVER_CACHE_MAX:
+        _RESOLVER_CACHE.clear()
+    _RESOLVER_CACHE[host] = (ip, now + _RESOLVER_TTL)
+    return ip
+
+
+def _run_scan(
+    ip: str,
+    ports: Sequence[int],
+    timeout: float,
+    workers: int,
+    results: "queue.SimpleQueue[Any]",
+    stop: threading.Event,
+) -> None:
+    """
+    Scan ports chunk by chunk, handing open ports to a streaming response.
+
+    The scan checks ``stop`` between chunks, so a scan whose client has
+    gone away stops submitting probes to the shared executor.
+
+    Args:
+        ip: The resolved IP address to scan
+        ports: Sorted sequence of port numbers to scan
+        timeout: Socket timeout in seconds
+        workers: Number of ports probed per chunk
+        results: Receives each open ScanResult, then None when the scan
+            ends, or the exception that stopped it
+        stop: Set by the response once it no longer needs results
+    """
+    try:
+        for start in range(0, len(ports), workers):
+            if stop.is_set():
+                break
+            for result in stream_open_ports(
+                ip, ports[start:start + workers], timeout, workers,
+                executor=_EXECUTOR
+            ):
+                results.put(result)
+    except Exception as e:
+        results.put(e)
+    else:
+        results.put(None)
+
 
 @app.route("/")
 def index():
@@ -31,12 +175,22 @@ def scan():
     """
     API endpoint to perform a port scan.
 
+    The response body is streamed: the header fields and each open port are
+    written out as the scan finds them, so large scans never hold the whole
+    result list or its encoded JSON in memory. The scan itself runs on a
+    background thread; the request thread only relays its results and
+    stops the scan if the client disconnects. "success" is written last: an
+    error during the scan ends the document with "success": false and an
+    "error" field after whatever results were already sent. "timeout" is
+    clamped to 0.1-10 seconds and "workers" to 64, so one request cannot
+    monopolise the executor shared by all scans.
+
     Expected JSON payload:
     {
         "target": "hostname or IP",
         "ports": "port specification (e.g., '1-1024' or '22,80,443')",
         "timeout": 0.5,
-        "workers": 100
+        "workers": 64
     }
 
     Returns:
@@ -44,7 +198,9 @@ def scan():
         "success": true/false,
         "target": "hostname",
         "ports_scanned": "port specification",
+        "total_ports": 1024,
         "results": [...],
+        "open_ports": 3,
         "scan_time_seconds": 1.23,
         "error": "error message if failed"
     }
@@ -55,7 +211,8 @@ def scan():
         target = data.get("target", "").strip()
         port_spec = data.get("ports", "1-1024").strip()
         timeout = float(data.get("timeout", 0.5))
-        workers = int(data.get("workers", 100))
+        timeout = min(max(timeout, _MIN_TIMEOUT), _MAX_TIMEOUT)
+        workers = min(int(data.get("workers", _MAX_WORKERS)), _MAX_WORKERS)
 
         # Validate inputs
         if not target:
@@ -79,29 +236,54 @@ def scan():
                 "error": "No valid ports to scan"
             }), 400
 
-        # Perform scan
+        # Resolve before streaming so lookup failures get a proper error
         start_time = time.time()
-        results = scan_ports(
-            host=target,
-            ports=ports,
-            timeout=timeout,
-            max_workers=workers
-        )
-        scan_time = time.time() - start_time
-
-        # Filter to open ports only
-        open_results = [r for r in results if r["status"] == "open"]
+        ip = _resolve_cached(target)
 
-        return jsonify({
-            "success": True,
+        head = app.json.dumps({
             "target": target,
             "ports_scanned": port_spec,
-            "results": open_results,
-            "total_ports": len(ports),
-            "open_ports": len(open_results),
-            "scan_time_seconds": round(scan_time, 2)
+            "total_ports": len(ports)
         })
 
+        def generate():
+            results: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+            stop = threading.Event()
+            _SCAN_EXECUTOR.submit(
+                _run_scan, ip, ports, timeout, workers, results, stop
+            )
+
+            open_count = 0
+            error = None
+            try:
+                yield head[:-1] + ',"results":['
+
+                while True:
+                    result = results.get()
+                    if result is None:
+                        break
+                    if isinstance(result, Exception):
+                        # The 200 status is already sent, so report it in
+                        # the body
+                        error = str(result)
+                        break
+                    yield ("," if open_count else "") + app.json.dumps(result)
+                    open_count += 1
+            finally:
+                # Also reached when the client disconnects mid-stream
+                stop.set()
+
+            footer = {
+                "success": error is None,
+                "open_ports": open_count,
+                "scan_time_seconds": round(time.time() - start_time, 2)
+            }
+            if error is not None:
+                footer["error"] = error
+            yield "]," + app.json.dumps(footer)[1:]
+
+        return Response(generate(), mimetype="application/json")
+
     except Exception as e:
         return jsonify({
             "success": False,